@@ -5,10 +5,41 @@ Usage: python3 json_to_geojson.py <input.json> <output.geojson>
        python3 json_to_geojson.py ~/Downloads/ru-borders.json ru-borders.geojson
 """
 
-import json
 import sys
 import os
 
+import numpy as np
+import orjson
+
+# Pieces of an indented FeatureCollection written around the streamed features
+FEATURE_COLLECTION_HEADER = b'{\n  "type": "FeatureCollection",\n  "features": ['
+FEATURE_COLLECTION_FOOTER = b'\n  ]\n}'
+FEATURE_INDENT = b'    '
+
+def to_float(value):
+    """Convert a single coordinate to float, returning NaN if it is invalid."""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return np.nan
+
+def parse_coordinates(values):
+    """
+    Convert a list of coordinate values to a float64 array.
+    
+    The whole column is converted in a single numpy call; if it contains a
+    value numpy cannot parse, or a non-scalar (e.g. list) value that numpy
+    turns into an extra dimension, fall back to converting each value.
+    Invalid and missing (None) values end up as NaN.
+    """
+    try:
+        coordinates = np.asarray(values, dtype=np.float64)
+        if coordinates.ndim == 1 and len(coordinates) == len(values):
+            return coordinates
+    except (ValueError, TypeError):
+        pass
+    return np.fromiter((to_float(v) for v in values), dtype=np.float64, count=len(values))
+
 def json_to_geojson(input_path, output_path):
     """
     Convert a JSON array of points to GeoJSON FeatureCollection.
@@ -36,8 +67,8 @@ def json_to_geojson(input_path, output_path):
     
     print(f"Reading {input_path}...")
     
-    with open(input_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with open(input_path, 'rb') as f:
+        data = orjson.loads(f.read())
     
     if not isinstance(data, list):
         print("Error: Input JSON must be an array")
@@ -45,49 +76,49 @@ def json_to_geojson(input_path, output_path):
     
     print(f"Found {len(data)} points")
     
-    # Create GeoJSON structure
-    geojson = {
-        "type": "FeatureCollection",
-        "features": []
-    }
-    
     skipped = 0
+    written = 0
     
-    for item in data:
-        # Extract coordinates
-        try:
-            lat = float(item.get('latitude', 0))
-            lon = float(item.get('longitude', 0))
-        except (ValueError, TypeError):
-            print(f"Warning: Skipping item with invalid coordinates: {item.get('name', 'Unknown')}")
-            skipped += 1
-            continue
-        
-        # Create properties (all fields except lat/lon)
-        properties = {}
-        for key, value in item.items():
-            if key not in ['latitude', 'longitude']:
-                properties[key] = value
+    # Extract coordinates column-wise
+    lats = parse_coordinates([item.get('latitude', 0) for item in data])
+    lons = parse_coordinates([item.get('longitude', 0) for item in data])
+    valid = np.isfinite(lats) & np.isfinite(lons)
+    
+    # Stream the FeatureCollection to the output one feature at a time, laid out
+    # exactly as an indented dump of the whole collection would be
+    with open(output_path, 'wb') as f:
+        f.write(FEATURE_COLLECTION_HEADER)
         
-        # Create GeoJSON feature
-        feature = {
-            "type": "Feature",
-            "geometry": {
-                "type": "Point",
-                "coordinates": [lon, lat]  # GeoJSON uses [longitude, latitude]
-            },
-            "properties": properties
-        }
+        for item, lat, lon, is_valid in zip(data, lats.tolist(), lons.tolist(), valid.tolist()):
+            if not is_valid:
+                print(f"Warning: Skipping item with invalid coordinates: {item.get('name', 'Unknown')}")
+                skipped += 1
+                continue
+            
+            # Reuse the item as properties (all fields except lat/lon)
+            item.pop('latitude', None)
+            item.pop('longitude', None)
+            
+            # Create GeoJSON feature
+            feature = {
+                "type": "Feature",
+                "geometry": {
+                    "type": "Point",
+                    "coordinates": [lon, lat]  # GeoJSON uses [longitude, latitude]
+                },
+                "properties": item
+            }
+            
+            # Indent the feature one level deeper than the "features" array
+            f.write(b'\n' if written == 0 else b',\n')
+            f.write(FEATURE_INDENT + orjson.dumps(feature, option=orjson.OPT_INDENT_2).replace(b'\n', b'\n' + FEATURE_INDENT))
+            written += 1
         
-        geojson["features"].append(feature)
-    
-    # Write output
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(geojson, f, ensure_ascii=False, indent=2)
-    
+        f.write(FEATURE_COLLECTION_FOOTER if written else b']\n}')
+
     print(f"\n✅ Success!")
     print(f"   Output: {output_path}")
-    print(f"   Features: {len(geojson['features'])}")
+    print(f"   Features: {written}")
     if skipped > 0:
         print(f"   Skipped: {skipped}")
 
@@ -1,6 +1,8 @@
 # transliterate_geojson.py
 # Usage: python3 transliterate_geojson.py
-import json, re, sys, os
+import re, sys, os
+
+import orjson
 
 input_path = "kaz-avto.geojson"
 output_path = "kaz-avto-transliterated.geojson"
@@ -16,24 +18,23 @@ mapping = {
     # Kazakh letters
     'Ә':'A','ә':'a','Ө':'O','ө':'o','Ұ':'U','ұ':'u','Ү':'U','ү':'u','Қ':'Q','қ':'q','Ғ':'Gh','ғ':'gh','Ң':'Ng','ң':'ng','Һ':'H','һ':'h','І':'I','і':'i',
 }
+# Quote characters that might be embedded in names; removed during transliteration
+quotes = ['“','”','«','»','"', "'", '’', '‘', "`"]
+
+# Translation table built once from the mapping (values may be multi-char or empty)
+_TABLE = str.maketrans({**mapping, **{ch: None for ch in quotes}})
+
+# "Статус:" followed by the status value
+_STATUS_RE = re.compile(r'Статус:\s*([^\n<]+)')
 
 def transliterate(text):
     """Remove internal quotes, transliterate Cyrillic letters to Latin approximation, and capitalize."""
     if not isinstance(text, str):
         return text
-    # remove various quote characters that might be embedded
-    for ch in ['“','”','«','»','"', "'", '’', '‘', "`"]:
-        text = text.replace(ch, '')
-    # transliterate char-by-char
-    out = []
-    for ch in text:
-        out.append(mapping.get(ch, ch))
-    result = ''.join(out)
-    # collapse multiple spaces, strip edges
-    result = re.sub(r'\s+', ' ', result).strip()
-    # capitalize each word (title case)
-    result = result.title()
-    return result
+    # strip quotes and transliterate in a single pass
+    result = text.translate(_TABLE)
+    # collapse whitespace runs and strip edges (split/join), then title case each word
+    return ' '.join(result.split()).title()
 
 def extract_status(description):
     """Extract status from description and return numeric value.
@@ -46,16 +47,20 @@ def extract_status(description):
     if not isinstance(description, str):
         return None
     
+    # Cheap substring check before running the regex
+    if 'Статус:' not in description:
+        return None
+    
     # Look for "Статус:" followed by the status value
-    status_match = re.search(r'Статус:\s*([^\n<]+)', description)
+    status_match = _STATUS_RE.search(description)
     if status_match:
-        status_text = status_match.group(1).strip()
+        status_text = status_match.group(1).lower()
         
         # Check for bilateral (Двухсторонний)
-        if 'Двухсторонний' in status_text or 'двухсторонний' in status_text:
+        if 'двухсторонний' in status_text:
             return 1
         # Check for multilateral (Многосторонний)
-        elif 'Многосторонний' in status_text or 'многосторонний' in status_text:
+        elif 'многосторонний' in status_text:
             return 2
     
     return None
@@ -65,8 +70,8 @@ def main():
         print("Input file not found:", input_path)
         sys.exit(1)
 
-    with open(input_path, 'r', encoding='utf-8') as f:
-        geo = json.load(f)
+    with open(input_path, 'rb') as f:
+        geo = orjson.loads(f.read())
 
     features = geo.get('features', [])
     name_keys = ['name','Name','NAME','title','label']
@@ -100,8 +105,8 @@ def main():
         
         feat['properties'] = props
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(geo, f, ensure_ascii=False, indent=2)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(geo, option=orjson.OPT_INDENT_2))
 
     print(f"Done. Wrote {output_path}")
     print(f"  - Processed {len(features)} features")
@@ -4,14 +4,115 @@ GeoJSON Validator Script
 Validates GeoJSON files for proper structure and geometry
 """
 
-import json
 import sys
 from pathlib import Path
 
+import ijson
+
+VALID_TYPES = ['FeatureCollection', 'Feature', 'GeometryCollection',
+               'Point', 'LineString', 'Polygon', 'MultiPoint',
+               'MultiLineString', 'MultiPolygon']
+
+# ijson events that begin a value (scalars, objects and arrays)
+VALUE_EVENTS = ('null', 'boolean', 'integer', 'double', 'number', 'string',
+                'start_map', 'start_array')
+
+def event_value(event, value):
+    """
+    Value to record for a streamed 'type' property
+    
+    Args:
+        event: ijson event that begins the value (one of VALUE_EVENTS)
+        value: ijson value for the event
+        
+    Returns:
+        The scalar value, or '<object>' / '<array>' for a non-scalar
+    """
+    if event == 'start_map':
+        return '<object>'
+    if event == 'start_array':
+        return '<array>'
+    return value
+
+# Marks an array element in a parse path, so it can't collide with an object key
+ITEM = object()
+
+# Parse paths the validator looks at; keys containing dots stay a single component
+TYPE_PATH = ('type',)
+FEATURES_PATH = ('features',)
+FEATURE_PATH = ('features', ITEM)
+FEATURE_TYPE_PATH = ('features', ITEM, 'type')
+GEOMETRY_PATH = ('features', ITEM, 'geometry')
+COORDINATES_PATH = ('features', ITEM, 'geometry', 'coordinates')
+MAX_PATH_DEPTH = len(COORDINATES_PATH)
+
+def parse_paths(f, max_depth):
+    """
+    Stream ijson events with the path of each event as a tuple of keys
+    
+    Unlike ijson.parse, whose prefixes join keys with dots, the path keeps
+    each key as its own component, with ITEM for array elements. Events
+    deeper than max_depth (e.g. individual coordinates) are not yielded.
+    
+    Args:
+        f: Binary file object with the JSON document
+        max_depth: Deepest path length to yield
+        
+    Yields:
+        tuple: (path, event, value)
+    """
+    path = []
+    for event, value in ijson.basic_parse(f, use_float=True):
+        if event == 'end_map' or event == 'end_array':
+            path.pop()
+        # A map_key belongs to its object, one level above the key slot
+        depth = len(path) - 1 if event == 'map_key' else len(path)
+        if depth <= max_depth:
+            yield tuple(path[:depth]), event, value
+        if event == 'map_key':
+            path[-1] = value
+        elif event == 'start_map':
+            path.append(None)
+        elif event == 'start_array':
+            path.append(ITEM)
+
+def check_feature(i, feature, errors, warnings):
+    """
+    Check the structure summary of a single feature collected while streaming
+    
+    Args:
+        i: Index of the feature in the 'features' array
+        feature: dict with the feature's keys, type and geometry details
+        errors: list to append errors to
+        warnings: list to append warnings to
+    """
+    if 'type' not in feature['keys']:
+        errors.append(f"Feature {i} missing 'type' property")
+    elif feature['type'] != 'Feature':
+        errors.append(f"Feature {i} has invalid type: {feature['type']}")
+    
+    if 'geometry' not in feature['keys']:
+        errors.append(f"Feature {i} missing 'geometry' property")
+    elif feature['geometry_is_null']:
+        warnings.append(f"  ⚠ Feature {i} has null geometry")
+    elif 'type' not in feature['geometry_keys']:
+        errors.append(f"Feature {i} geometry missing 'type' property")
+    elif 'coordinates' not in feature['geometry_keys']:
+        errors.append(f"Feature {i} geometry missing 'coordinates' property")
+    elif not feature['coordinates_is_array']:
+        # Check if coordinates is valid
+        errors.append(f"Feature {i} geometry coordinates is not an array")
+    
+    if 'properties' not in feature['keys']:
+        errors.append(f"Feature {i} missing 'properties' property")
+
 def validate_geojson(file_path):
     """
     Validate a GeoJSON file
     
+    The file is streamed with ijson and checked event by event, so the
+    feature tree (coordinates, properties) is never built in memory.
+    
     Args:
         file_path: Path to the GeoJSON file
         
@@ -19,72 +120,94 @@ def validate_geojson(file_path):
         tuple: (is_valid, errors)
     """
     errors = []
+    feature_errors = []
+    warnings = []
+    top_level_keys = set()
+    geojson_type = None
+    features_is_array = True
+    feature = None
+    feature_count = 0
     
     try:
-        # Read the file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Stream the parse events: (path, event, value)
+        with open(file_path, 'rb') as f:
+            for path, event, value in parse_paths(f, MAX_PATH_DEPTH):
+                if path == ():
+                    if event == 'map_key':
+                        top_level_keys.add(value)
+                elif path == TYPE_PATH:
+                    if event in VALUE_EVENTS:
+                        geojson_type = event_value(event, value)
+                elif path == FEATURES_PATH:
+                    if event not in ('start_array', 'end_array'):
+                        features_is_array = False
+                elif path == FEATURE_PATH:
+                    if event == 'start_map':
+                        feature = {
+                            'keys': set(),
+                            'type': None,
+                            'geometry_keys': set(),
+                            'geometry_is_null': False,
+                            'coordinates_is_array': True,
+                        }
+                    elif event == 'map_key':
+                        feature['keys'].add(value)
+                    elif event == 'end_map':
+                        check_feature(feature_count, feature, feature_errors, warnings)
+                        feature_count += 1
+                    elif event != 'end_array':
+                        # A scalar or an array where a feature object should be
+                        feature_errors.append(f"Feature {feature_count} is not an object")
+                        feature_count += 1
+                elif path == FEATURE_TYPE_PATH:
+                    if event in VALUE_EVENTS:
+                        feature['type'] = event_value(event, value)
+                elif path == GEOMETRY_PATH:
+                    if event == 'null':
+                        feature['geometry_is_null'] = True
+                    elif event == 'map_key':
+                        feature['geometry_keys'].add(value)
+                elif path == COORDINATES_PATH:
+                    if event not in ('start_array', 'end_array'):
+                        feature['coordinates_is_array'] = False
         
-        # Check if it's a valid JSON
+        # The whole file was parsed, so it's a valid JSON
         print(f"✓ Valid JSON structure")
         
         # Check for required GeoJSON properties
-        if 'type' not in data:
+        if 'type' not in top_level_keys:
             errors.append("Missing 'type' property")
         else:
-            print(f"✓ Has 'type' property: {data['type']}")
+            print(f"✓ Has 'type' property: {geojson_type}")
             
-            if data['type'] not in ['FeatureCollection', 'Feature', 'GeometryCollection', 
-                                   'Point', 'LineString', 'Polygon', 'MultiPoint', 
-                                   'MultiLineString', 'MultiPolygon']:
-                errors.append(f"Invalid type: {data['type']}")
+            if geojson_type not in VALID_TYPES:
+                errors.append(f"Invalid type: {geojson_type}")
         
-        # If it's a FeatureCollection, validate features
-        if data.get('type') == 'FeatureCollection':
-            if 'features' not in data:
+        # If it's a FeatureCollection, report the feature checks
+        if geojson_type == 'FeatureCollection':
+            if 'features' not in top_level_keys:
                 errors.append("FeatureCollection missing 'features' array")
+            elif not features_is_array:
+                errors.append("FeatureCollection 'features' is not an array")
             else:
-                features = data['features']
-                print(f"✓ Has 'features' array with {len(features)} features")
-                
-                # Validate each feature
-                for i, feature in enumerate(features):
-                    if 'type' not in feature:
-                        errors.append(f"Feature {i} missing 'type' property")
-                    elif feature['type'] != 'Feature':
-                        errors.append(f"Feature {i} has invalid type: {feature['type']}")
-                    
-                    if 'geometry' not in feature:
-                        errors.append(f"Feature {i} missing 'geometry' property")
-                    else:
-                        geometry = feature['geometry']
-                        if geometry is None:
-                            print(f"  ⚠ Feature {i} has null geometry")
-                        elif 'type' not in geometry:
-                            errors.append(f"Feature {i} geometry missing 'type' property")
-                        elif 'coordinates' not in geometry:
-                            errors.append(f"Feature {i} geometry missing 'coordinates' property")
-                        else:
-                            # Check if coordinates is valid
-                            if not isinstance(geometry['coordinates'], list):
-                                errors.append(f"Feature {i} geometry coordinates is not an array")
-                    
-                    if 'properties' not in feature:
-                        errors.append(f"Feature {i} missing 'properties' property")
+                print(f"✓ Has 'features' array with {feature_count} features")
+                for warning in warnings:
+                    print(warning)
+                errors.extend(feature_errors)
                 
                 if not errors:
-                    print(f"✓ All {len(features)} features are valid")
+                    print(f"✓ All {feature_count} features are valid")
         
         # If it's a Feature, validate it
-        elif data.get('type') == 'Feature':
-            if 'geometry' not in data:
+        elif geojson_type == 'Feature':
+            if 'geometry' not in top_level_keys:
                 errors.append("Feature missing 'geometry' property")
-            if 'properties' not in data:
+            if 'properties' not in top_level_keys:
                 errors.append("Feature missing 'properties' property")
         
         return len(errors) == 0, errors
         
-    except json.JSONDecodeError as e:
+    except ijson.JSONError as e:
         errors.append(f"Invalid JSON: {str(e)}")
         return False, errors
     except Exception as e: